@@ -0,0 +1,48 @@
+"""
+Shared helpers for Figmaker's on-disk caches under ``~/.cache/figmaker``.
+
+Every cache is an optimization only: write failures are swallowed by the
+callers, and each directory is kept to a bounded number of entries.
+"""
+
+from __future__ import annotations
+import os
+import threading
+from pathlib import Path
+from typing import Set
+
+CACHE_ROOT = Path.home() / ".cache" / "figmaker"
+
+# Directories already pruned by this process; pruning once per run is enough
+_pruned: Set[Path] = set()
+_prune_lock = threading.Lock()
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a temporary file, so readers never see a partial entry."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def prune(directory: Path, max_entries: int) -> None:
+    """Delete the least recently modified entries of ``directory`` beyond ``max_entries``."""
+    with _prune_lock:
+        if directory in _pruned:
+            return
+        _pruned.add(directory)
+
+    try:
+        entries = [entry for entry in os.scandir(directory) if entry.is_file()]
+    except OSError:
+        return
+    if len(entries) <= max_entries:
+        return
+
+    entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+    for entry in entries[:len(entries) - max_entries]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
@@ -0,0 +1,104 @@
+"""
+On-disk cache of parsed recipes.
+
+Parsing YAML and running Pydantic validation dominates the start-up cost of
+``figmaker render`` and ``figmaker validate``. Validated :class:`Recipe`
+objects are pickled under ``~/.cache/figmaker`` keyed on the recipe path,
+modification time and size, plus the recipe schema, so repeated runs on an
+unchanged recipe skip both steps.
+"""
+
+from __future__ import annotations
+import functools
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+from typing import Union
+
+import yaml
+
+from . import __version__, recipes
+from ._cache import CACHE_ROOT, prune, write_atomic
+from .recipes import Recipe
+
+# Prefer the libyaml-backed C parser; fall back to pure Python
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson  # Optional: faster parsing of .json recipes
+except ImportError:
+    orjson = None
+
+CACHE_DIR = CACHE_ROOT
+CACHE_MAX_ENTRIES = 256
+
+
+@functools.lru_cache(maxsize=1)
+def _schema_fingerprint() -> str:
+    """Hash of the recipe models, so schema edits in a dev install invalidate pickles."""
+    try:
+        source = Path(recipes.__file__).read_bytes()
+    except OSError:
+        source = json.dumps(Recipe.model_json_schema(), sort_keys=True).encode("utf-8")
+    return hashlib.sha256(source).hexdigest()
+
+
+def _cache_file(path: Path, st: os.stat_result) -> Path:
+    """Return the cache entry for a recipe at its current mtime and size."""
+    key = f"{__version__}:{_schema_fingerprint()}:{path.resolve()}:{st.st_mtime_ns}:{st.st_size}"
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"recipe-{digest}.pkl"
+
+
+def load_recipe(path: Union[str, Path]) -> Recipe:
+    """Parse and validate a recipe file (YAML, or JSON by extension) without the cache."""
+    if Path(path).suffix.lower() == ".json":
+        if orjson is not None:
+            with open(path, "rb") as f:
+                recipe_data = orjson.loads(f.read())
+        else:
+            with open(path, "r") as f:
+                recipe_data = json.load(f)
+    else:
+        with open(path, "r") as f:
+            recipe_data = yaml.load(f, Loader=_YamlLoader)
+    return Recipe.model_validate(recipe_data)
+
+
+def load_recipe_cached(path: Union[str, Path]) -> Recipe:
+    """
+    Load a validated recipe, reusing a cached copy when the file is unchanged.
+
+    Args:
+        path: Path to the recipe YAML or JSON file
+
+    Returns:
+        Validated Recipe object
+    """
+    path = Path(path)
+    cache_file = _cache_file(path, path.stat())
+
+    try:
+        with open(cache_file, "rb") as f:
+            recipe = pickle.load(f)
+        if isinstance(recipe, Recipe):
+            return recipe
+    except Exception:
+        # Missing, truncated or stale entries are simply rebuilt
+        pass
+
+    recipe = load_recipe(path)
+
+    try:
+        write_atomic(cache_file, pickle.dumps(recipe, protocol=pickle.HIGHEST_PROTOCOL))
+        prune(CACHE_DIR, CACHE_MAX_ENTRIES)
+    except OSError:
+        # The cache is an optimization only; read-only homes are fine
+        pass
+
+    return recipe
@@ -6,20 +6,37 @@ validating configurations, and managing templates.
 """
 
 from __future__ import annotations
+import json
+import os
 import platform
 import sys
 import yaml
 import typer
-import importlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from .recipes import Recipe
 from .styles import apply_style
 from .loader import load_table, fingerprint, save_metadata
 from .transforms import apply_pipeline
-from .layout import build_canvas
-from .plots.image_panel import ImagePanelAssembler
+from .layout import build_canvas, get_plot_module
+from .plots.image_panel import ImagePanelAssembler, open_frames
+from ._recipe_cache import load_recipe_cached
+
+# Prefer the libyaml-backed C emitter; fall back to pure Python
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+try:
+    import orjson  # Optional: faster JSON recipe output
+except ImportError:
+    orjson = None
+
+# Below this much input, worker process start-up costs more than parallel parsing saves
+PROCESS_POOL_MIN_BYTES = 64 * 1024 * 1024
 
 app = typer.Typer(
     name="figmaker",
@@ -30,9 +47,10 @@ app = typer.Typer(
 
 @app.command()
 def render(
-    recipe: str = typer.Argument(..., help="Path to the recipe YAML file"),
+    recipe: str = typer.Argument(..., help="Path to the recipe YAML or JSON file"),
     output_dir: Optional[str] = typer.Option(None, "--output-dir", "-o", help="Output directory"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Validate recipe without rendering"),
+    fast: bool = typer.Option(False, "--fast", help="Favor export speed over file size (light PNG compression)"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
 ) -> None:
     """
@@ -48,10 +66,7 @@ def render(
             typer.echo(f"Recipe file not found: {recipe}", err=True)
             raise typer.Exit(1)
         
-        with open(recipe_path, "r") as f:
-            recipe_data = yaml.safe_load(f)
-        
-        r = Recipe.model_validate(recipe_data)
+        r = load_recipe_cached(recipe_path)
         
         if verbose:
             typer.echo(f"Loaded recipe: {recipe_path}")
@@ -73,9 +88,9 @@ def render(
         
         # Check if this is an image-only recipe (legacy Figmaker style)
         if all(panel.plot == "image_panel" for panel in r.figure.panels):
-            _render_image_figure(r, output_path, verbose)
+            _render_image_figure(r, output_path, verbose, fast)
         else:
-            _render_mixed_figure(r, output_path, verbose)
+            _render_mixed_figure(r, output_path, verbose, fast)
             
         typer.echo("✓ Figure rendered successfully")
         
@@ -87,18 +102,27 @@ def render(
         raise typer.Exit(1)
 
 
-def _render_image_figure(recipe: Recipe, output_path: Path, verbose: bool) -> None:
+def _render_image_figure(recipe: Recipe, output_path: Path, verbose: bool, fast: bool = False) -> None:
     """Render a figure containing only image panels (legacy Figmaker style)."""
     assembler = ImagePanelAssembler()
     
-    # Add panels
+    # Resolve each panel's image; data-driven image panels use the data source path
+    data_paths = {ds.name: ds.path for ds in recipe.data}
+    sources = []
     for panel in recipe.figure.panels:
-        if panel.image_path:
-            assembler.add_panel(panel.image_path, panel.title)
-        elif panel.data in {ds.name for ds in recipe.data}:
-            # Handle data-driven image panels
-            data_source = next(ds for ds in recipe.data if ds.name == panel.data)
-            assembler.add_panel(data_source.path, panel.title)
+        path = panel.image_path or data_paths.get(panel.data)
+        if path:
+            sources.append((panel, path, int(panel.kwargs.get("page", 0))))
+    
+    # Panels can pick frames of a multi-page file (kwargs: {page: N}); open each such file once
+    pages_by_path: Dict[str, List[int]] = {}
+    for _, path, page in sources:
+        pages_by_path.setdefault(path, []).append(page)
+    frames = {path: open_frames(path, pages) for path, pages in pages_by_path.items() if any(pages)}
+    
+    # Add panels; repeated single-frame paths share one decode through the assembler's cache
+    for panel, path, page in sources:
+        assembler.add_panel(path, panel.title, image=frames[path][page] if path in frames else None)
     
     # Assemble figure
     assembled = assembler.assemble_figure(
@@ -110,22 +134,55 @@ def _render_image_figure(recipe: Recipe, output_path: Path, verbose: bool) -> No
     )
     
     # Export
-    _export_figure_pil(assembled, recipe, output_path, verbose)
+    _export_figure_pil(assembled, recipe, output_path, verbose, fast)
+
 
+def _load_data_sources(
+    recipe: Recipe, verbose: bool
+) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """Load every data source and its fingerprint, keyed by data source name.
+    
+    Parsing is CPU-bound and holds the GIL, so recipes with several sources
+    totalling at least PROCESS_POOL_MIN_BYTES are loaded in worker processes.
+    Hashing releases the GIL, so fingerprints are computed on threads in this
+    process while the tables load.
+    """
+    if verbose:
+        for ds in recipe.data:
+            typer.echo(f"Loading data: {ds.name} from {ds.path}")
+    
+    max_workers = min(len(recipe.data), os.cpu_count() or 1) or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as threads:
+        prints = {ds.name: threads.submit(fingerprint, ds.path) for ds in recipe.data}
+        
+        if len(recipe.data) < 2 or _total_size(ds.path for ds in recipe.data) < PROCESS_POOL_MIN_BYTES:
+            data_map = {ds.name: load_table(ds.path, ds.sheet) for ds in recipe.data}
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as processes:
+                tables = {ds.name: processes.submit(load_table, ds.path, ds.sheet) for ds in recipe.data}
+                data_map = {name: future.result() for name, future in tables.items()}
+        
+        fps = {name: future.result().__dict__ for name, future in prints.items()}
+    return data_map, fps
 
-def _render_mixed_figure(recipe: Recipe, output_path: Path, verbose: bool) -> None:
+
+def _total_size(paths) -> int:
+    """Total size in bytes of the files that exist among paths."""
+    total = 0
+    for path in paths:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass  # Reported by load_table
+    return total
+
+
+def _render_mixed_figure(recipe: Recipe, output_path: Path, verbose: bool, fast: bool = False) -> None:
     """Render a figure with mixed panel types using matplotlib."""
     import matplotlib.pyplot as plt
     
     # Load data sources
-    data_map = {}
-    fps = {}
-    
-    for ds in recipe.data:
-        if verbose:
-            typer.echo(f"Loading data: {ds.name} from {ds.path}")
-        data_map[ds.name] = load_table(ds.path, ds.sheet)
-        fps[ds.name] = fingerprint(ds.path).__dict__
+    data_map, fps = _load_data_sources(recipe, verbose)
     
     # Create canvas
     fig, axes = build_canvas(
@@ -145,16 +202,16 @@ def _render_mixed_figure(recipe: Recipe, output_path: Path, verbose: bool) -> No
             if panel.data in data_map:
                 df = data_map[panel.data].copy()
                 if panel.transforms:
-                    df = apply_pipeline(df, [t.model_dump() for t in panel.transforms])
+                    df = apply_pipeline(df, panel.transform_dicts)
             else:
                 df = None
             
             # Import and call plot function
-            module = importlib.import_module(f"figmaker.plots.{panel.plot}")
+            module = get_plot_module(panel.plot)
             
             # Handle different plot types
             if panel.plot == "image_panel" and panel.image_path:
-                module.draw(ax, panel.image_path, panel.title, **panel.kwargs)
+                module.draw(ax, panel.image_path, panel.title, **{"dpi": recipe.figure.dpi, **panel.kwargs})
             elif df is not None and panel.x and panel.y:
                 module.draw(ax, df, panel.x, panel.y, panel.hue, **panel.kwargs)
             else:
@@ -182,33 +239,46 @@ def _render_mixed_figure(recipe: Recipe, output_path: Path, verbose: bool) -> No
     }
     
     # Export
-    _export_figure_matplotlib(fig, recipe, output_path, meta, verbose)
+    _export_figure_matplotlib(fig, recipe, output_path, meta, verbose, fast)
 
 
 def _export_figure_pil(
-    image, recipe: Recipe, output_path: Path, verbose: bool
+    image, recipe: Recipe, output_path: Path, verbose: bool, fast: bool = False
 ) -> None:
     """Export PIL image figure."""
+    # Convert at most once, and never in place: later formats keep the alpha channel
+    rgb_image = None
+    
     for fmt, filename in recipe.figure.export.items():
         filepath = output_path / filename
         
         if verbose:
             typer.echo(f"Exporting {fmt.upper()}: {filepath}")
         
-        if fmt.lower() in ['png', 'tiff']:
+        if fmt.lower() == 'png' and fast:
+            image.save(filepath, dpi=(recipe.figure.dpi, recipe.figure.dpi), compress_level=1, optimize=False)
+        elif fmt.lower() in ['png', 'tiff']:
             image.save(filepath, dpi=(recipe.figure.dpi, recipe.figure.dpi))
         elif fmt.lower() == 'pdf':
-            if image.mode != 'RGB':
-                image = image.convert('RGB')
-            image.save(filepath, format='PDF', resolution=recipe.figure.dpi)
+            if rgb_image is None:
+                rgb_image = image if image.mode == 'RGB' else image.convert('RGB')
+            rgb_image.save(filepath, format='PDF', resolution=recipe.figure.dpi)
         else:
             image.save(filepath)
 
 
 def _export_figure_matplotlib(
-    fig, recipe: Recipe, output_path: Path, meta: Dict[str, Any], verbose: bool
+    fig, recipe: Recipe, output_path: Path, meta: Dict[str, Any], verbose: bool, fast: bool = False
 ) -> None:
     """Export matplotlib figure."""
+    import matplotlib as mpl
+    
+    # Resolve bbox_inches='tight' once instead of re-measuring in every savefig
+    tight_bbox = None
+    if any(fmt.lower() in ['svg', 'pdf', 'png'] for fmt in recipe.figure.export):
+        fig.canvas.draw()
+        tight_bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(mpl.rcParams['savefig.pad_inches'])
+    
     for fmt, filename in recipe.figure.export.items():
         filepath = output_path / filename
         
@@ -219,8 +289,9 @@ def _export_figure_matplotlib(
             fig.savefig(
                 filepath,
                 dpi=recipe.figure.dpi if fmt.lower() == 'png' else None,
-                bbox_inches='tight',
-                transparent=(recipe.figure.background == "transparent")
+                bbox_inches=tight_bbox,
+                transparent=(recipe.figure.background == "transparent"),
+                **({'pil_kwargs': {'compress_level': 1}} if fmt.lower() == 'png' and fast else {})
             )
     
     # Save metadata
@@ -230,7 +301,7 @@ def _export_figure_matplotlib(
 
 @app.command()
 def validate(
-    recipe: str = typer.Argument(..., help="Path to the recipe YAML file"),
+    recipe: str = typer.Argument(..., help="Path to the recipe YAML or JSON file"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
 ) -> None:
     """
@@ -244,10 +315,7 @@ def validate(
             typer.echo(f"Recipe file not found: {recipe}", err=True)
             raise typer.Exit(1)
         
-        with open(recipe_path, "r") as f:
-            recipe_data = yaml.safe_load(f)
-        
-        r = Recipe.model_validate(recipe_data)
+        r = load_recipe_cached(recipe_path)
         
         if verbose:
             typer.echo(f"Recipe: {recipe_path}")
@@ -310,8 +378,12 @@ def init(
     style: str = typer.Option("default", help="Figure style"),
     width: float = typer.Option(18.0, help="Figure width in cm"),
     height: float = typer.Option(12.0, help="Figure height in cm"),
+    json_format: bool = typer.Option(False, "--json", help="Write a JSON recipe, which loads faster than YAML"),
 ) -> None:
     """Create a new recipe template."""
+    if name.lower().endswith(".json"):
+        name, json_format = name[:-len(".json")], True
+    
     recipe_data = {
         "version": "1",
         "data": [],
@@ -328,9 +400,18 @@ def init(
         }
     }
     
-    filename = f"{name}.yaml"
-    with open(filename, "w") as f:
-        yaml.dump(recipe_data, f, indent=2, default_flow_style=False)
+    if json_format:
+        filename = f"{name}.json"
+        if orjson is not None:
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(recipe_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, "w") as f:
+                json.dump(recipe_data, f, indent=2)
+    else:
+        filename = f"{name}.yaml"
+        with open(filename, "w") as f:
+            yaml.dump(recipe_data, f, Dumper=_YamlDumper, indent=2, default_flow_style=False)
     
     typer.echo(f"Created recipe template: {filename}")
 
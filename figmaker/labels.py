@@ -0,0 +1,45 @@
+"""
+Panel label text shared by the GUI, the image assembler and the GridSpec layout.
+
+Styles match the "Panel Labels" dropdown of the GUI. Sequences that run out
+(past "Z", "z" or "x") continue with the panel number, so every style labels
+any number of panels.
+"""
+
+from __future__ import annotations
+from typing import Dict, List, Tuple
+
+DEFAULT_LABEL_STYLE = "A, B, C..."
+
+_ROMAN_NUMERALS = ("i", "ii", "iii", "iv", "v", "vi", "vii", "viii", "ix", "x")
+_MAX_LABELS = 100
+
+# Label text by style, then panel index; built once
+_LABELS: Dict[str, Tuple[str, ...]] = {
+    "A, B, C...": tuple(chr(65 + i) for i in range(26)),
+    "a, b, c...": tuple(chr(97 + i) for i in range(26)),
+    "1, 2, 3...": tuple(str(i + 1) for i in range(_MAX_LABELS)),
+    "i, ii, iii...": _ROMAN_NUMERALS,
+}
+
+# Style names in dropdown order; "None" (no labels) is accepted as well
+LABEL_STYLES: Tuple[str, ...] = tuple(_LABELS)
+
+
+def panel_label(label_style: str, panel_index: int) -> str:
+    """
+    Return the label of the panel at ``panel_index`` (zero-based).
+
+    Unknown styles use "A, B, C..."; indices past a style's sequence are numbered.
+    """
+    labels = _LABELS.get(label_style, _LABELS[DEFAULT_LABEL_STYLE])
+    if panel_index < len(labels):
+        return labels[panel_index]
+    return str(panel_index + 1)
+
+
+def panel_labels(label_style: str, n_panels: int) -> List[str]:
+    """Return the labels of ``n_panels`` panels, or an empty list for the "None" style."""
+    if label_style == "None":
+        return []
+    return [panel_label(label_style, i) for i in range(n_panels)]
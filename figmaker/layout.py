@@ -11,10 +11,26 @@ import matplotlib.pyplot as plt
 from matplotlib.gridspec import GridSpec
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
+from PIL import Image
+from types import ModuleType
 from typing import List, Tuple, Optional, Dict, Any
 import numpy as np
 import importlib
 
+from .labels import panel_labels
+
+# Plot modules resolved so far, keyed by plot type
+_PLOT_MODULE_CACHE: Dict[str, ModuleType] = {}
+
+
+def get_plot_module(plot_type: str) -> ModuleType:
+    """Import ``figmaker.plots.<plot_type>`` once and reuse it afterwards."""
+    module = _PLOT_MODULE_CACHE.get(plot_type)
+    if module is None:
+        module = importlib.import_module(f"figmaker.plots.{plot_type}")
+        _PLOT_MODULE_CACHE[plot_type] = module
+    return module
+
 
 def cm_to_in(cm: float) -> float:
     """Convert centimeters to inches."""
@@ -69,6 +85,7 @@ def build_canvas(
     )
     
     # Create axes for each panel
+    labels = panel_labels(label_style, n_panels)
     axes = []
     for i in range(n_panels):
         row, col = divmod(i, cols)
@@ -76,10 +93,9 @@ def build_canvas(
         axes.append(ax)
         
         # Add panel labels
-        if label_style != "None":
-            label_text = _get_label_text(label_style, i)
+        if labels:
             ax.text(
-                -0.15, 1.05, label_text,
+                -0.15, 1.05, labels[i],
                 transform=ax.transAxes,
                 fontsize=9,
                 fontweight="bold",
@@ -90,21 +106,6 @@ def build_canvas(
     return fig, axes
 
 
-def _get_label_text(label_style: str, panel_index: int) -> str:
-    """Generate label text based on style and index."""
-    if label_style == "A, B, C...":
-        return chr(65 + panel_index)
-    elif label_style == "a, b, c...":
-        return chr(97 + panel_index)
-    elif label_style == "1, 2, 3...":
-        return str(panel_index + 1)
-    elif label_style == "i, ii, iii...":
-        roman_numerals = ["i", "ii", "iii", "iv", "v", "vi", "vii", "viii", "ix", "x"]
-        return roman_numerals[panel_index] if panel_index < len(roman_numerals) else str(panel_index + 1)
-    else:
-        return chr(65 + panel_index)
-
-
 class FigureLayout:
     """
     Advanced layout manager for complex figure arrangements.
@@ -175,7 +176,7 @@ class FigureLayout:
             
             try:
                 # Dynamically import and call the appropriate plot function
-                module = importlib.import_module(f"figmaker.plots.{plot_type}")
+                module = get_plot_module(plot_type)
                 module.draw(ax, **kwargs)
                 
             except ImportError:
@@ -269,6 +270,18 @@ class AutoLayout:
 
 
 # Legacy compatibility functions for existing Figmaker GUI
+def _panel_size(panel_data: Dict[str, Any]) -> Tuple[int, int]:
+    """Get a panel's pixel size without decoding its image data."""
+    if 'width' in panel_data and 'height' in panel_data:
+        return panel_data['width'], panel_data['height']
+    img = panel_data.get('pil_image')
+    if img is not None:
+        return img.width, img.height
+    # Image.open only parses the header; pixels are decoded on load()
+    with Image.open(panel_data['original_path']) as img:
+        return img.size
+
+
 def create_legacy_layout(
     panels: List[Dict[str, Any]],
     target_width_in: float,
@@ -281,7 +294,9 @@ def create_legacy_layout(
     Create layout information compatible with legacy Figmaker logic.
     
     This function maintains compatibility with the existing GUI while
-    providing the same calculations in a more organized way.
+    providing the same calculations in a more organized way. Only panel sizes
+    are needed, so panels may carry ``width``/``height`` directly, a lazily
+    decoded ``pil_image``, or just an ``original_path`` whose header is read.
     
     Returns:
         Tuple of (total_width_px, total_height_px, layout_info_list)
@@ -298,50 +313,40 @@ def create_legacy_layout(
     available_width = total_width_px - (2 * margin_px)
     col_width_px = (available_width - (padding_px * (num_cols - 1))) // num_cols
     
-    # Calculate panel layouts and row heights
-    layouts = []
-    row_heights = []
-    current_row_max_h = 0
+    # Scale every panel to the column width while maintaining aspect ratio
+    n = len(panels)
+    images = [panel_data.get('pil_image') for panel_data in panels]
+    sizes = [_panel_size(panel_data) for panel_data in panels]
+    widths = np.fromiter((w for w, _ in sizes), dtype=np.int64, count=n)
+    heights = np.fromiter((h for _, h in sizes), dtype=np.int64, count=n)
+    # Same float scaling and truncation as ImagePanelAssembler, so the layouts agree to the pixel
+    scaled_h = (heights * (col_width_px / widths)).astype(np.int64)
     
-    for i, panel_data in enumerate(panels):
-        img = panel_data['pil_image']
-        
-        # Scale to fit column width while maintaining aspect ratio
-        scale = col_width_px / img.width
-        scaled_w = col_width_px
-        scaled_h = int(img.height * scale)
-        
-        # Calculate position
-        row = i // num_cols
-        col = i % num_cols
-        x = margin_px + col * (col_width_px + padding_px)
-        
-        layouts.append({
-            'width': scaled_w,
-            'height': scaled_h,
+    # Grid positions; the row height is the tallest panel in each row
+    index = np.arange(n)
+    rows = index // num_cols
+    cols = index % num_cols
+    xs = margin_px + cols * (col_width_px + padding_px)
+    row_heights = np.maximum.reduceat(scaled_h, np.arange(0, n, num_cols))
+    
+    # One running sum gives every row's y and, past the last row, the total height
+    row_ys = margin_px + np.concatenate(([0], np.cumsum(row_heights + padding_px)))
+    total_height_px = int(row_ys[-1]) - padding_px + margin_px
+    ys = row_ys[rows]
+    
+    layouts = [
+        {
+            'width': col_width_px,
+            'height': h,
             'image': img,
             'x': x,
             'row': row,
-            'col': col
-        })
-        
-        current_row_max_h = max(current_row_max_h, scaled_h)
-        
-        # Store row height at end of row or last panel
-        if (i + 1) % num_cols == 0 or (i + 1) == len(panels):
-            row_heights.append(current_row_max_h)
-            current_row_max_h = 0
-    
-    # Calculate total height
-    content_height = sum(row_heights) + padding_px * (len(row_heights) - 1)
-    total_height_px = content_height + (2 * margin_px)
-    
-    # Add y positions to layouts
-    current_y = margin_px
-    for i, layout in enumerate(layouts):
-        row = layout['row']
-        if row > 0 and i % num_cols == 0:
-            current_y += row_heights[row - 1] + padding_px
-        layout['y'] = current_y
+            'col': col,
+            'y': y
+        }
+        for img, h, x, row, col, y in zip(
+            images, scaled_h.tolist(), xs.tolist(), rows.tolist(), cols.tolist(), ys.tolist(), strict=True
+        )
+    ]
     
     return total_width_px, total_height_px, layouts
\ No newline at end of file
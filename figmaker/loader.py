@@ -6,13 +6,35 @@ for provenance tracking.
 """
 
 from __future__ import annotations
+import functools
 import hashlib
+import importlib.util
+import io
 import json
+import mmap
 import os
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+
+from ._cache import CACHE_ROOT, prune, write_atomic
+
+
+# Optional faster parsers, detected without importing them (pyarrow is slow to import)
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+_EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") is not None else None
+
+
+# BLAKE3 is several times faster than SHA-256 and only provenance depends on
+# the digest, so use it when installed; Fingerprint.algorithm records which
+try:
+    from blake3 import blake3 as _new_hasher
+    _HASH_ALGORITHM = "blake3"
+except ImportError:
+    _new_hasher = hashlib.sha256
+    _HASH_ALGORITHM = "sha256"
 
 
 @dataclass(frozen=True)
@@ -21,17 +43,105 @@ class Fingerprint:
     path: str
     size: int
     mtime: float
-    sha256: str
+    digest: str  # Hex digest computed with ``algorithm``
+    algorithm: str = "sha256"
+    sha256: Optional[str] = None  # Set only when ``algorithm`` is SHA-256
+    
+    def __post_init__(self):
+        if self.sha256 is None and self.algorithm == "sha256":
+            object.__setattr__(self, "sha256", self.digest)
 
 
-def _sha256(path: str, nbytes: int = 1_000_000) -> str:
-    """Compute SHA256 hash of file (first nbytes for large files)."""
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        h.update(f.read(nbytes))
+# Large enough for hashlib to release the GIL and amortize syscalls
+_HASH_CHUNK = 1 << 18
+# Files at least this big are hashed from a memory map instead of read()
+_MMAP_MIN_SIZE = 1 << 20
+_MMAP_WINDOW = 1 << 20
+
+
+def _hash_read(path: str) -> str:
+    """Hash the whole file, streamed in chunks."""
+    with open(path, "rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: reads into a reused buffer, no per-chunk bytes objects
+            return hashlib.file_digest(f, _new_hasher).hexdigest()
+        h = _new_hasher()
+        while buf := f.read(_HASH_CHUNK):
+            h.update(buf)
+    return h.hexdigest()
+
+
+def _hash_mmap(path: str) -> str:
+    """Hash the whole file from a read-only memory map.
+    
+    Windows of the mapping are passed to the hasher as memoryview slices, so
+    the bytes come straight from the page cache without a copy into Python.
+    """
+    h = _new_hasher()
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as mv:
+            for offset in range(0, len(mv), _MMAP_WINDOW):
+                h.update(mv[offset:offset + _MMAP_WINDOW])
     return h.hexdigest()
 
 
+def _content_hash(path: str, size: Optional[int] = None) -> Tuple[str, str]:
+    """Hash the whole file, returning (algorithm, hex digest)."""
+    if size is None:
+        size = os.path.getsize(path)
+    if size >= _MMAP_MIN_SIZE:
+        try:
+            return _HASH_ALGORITHM, _hash_mmap(path)
+        except (OSError, ValueError, OverflowError):
+            # e.g. address space limits on 32-bit builds; fall back to read()
+            pass
+    return _HASH_ALGORITHM, _hash_read(path)
+
+
+# Opt-in cache of digests between runs, keyed on algorithm, path, mtime and size.
+# Off by default: a provenance hash should come from the bytes, not from metadata
+FINGERPRINT_CACHE_ENV = "FIGMAKER_FINGERPRINT_CACHE"
+FINGERPRINT_CACHE_DIR = CACHE_ROOT / "fingerprints"
+FINGERPRINT_CACHE_MAX_ENTRIES = 4096
+
+
+def _persistent_cache_enabled() -> bool:
+    """Whether the user opted in to reusing digests across runs."""
+    return os.environ.get(FINGERPRINT_CACHE_ENV, "").lower() in ("1", "true", "yes")
+
+
+# Same-process hits skip the disk lookup too; bounded so long GUI sessions
+# touching many files do not grow it without limit
+@functools.lru_cache(maxsize=4096)
+def _memo_hash(abs_path: str, size: int, mtime_ns: int) -> str:
+    """Hash ``abs_path`` as of the given size and mtime, via the disk cache when enabled."""
+    if not _persistent_cache_enabled():
+        return _content_hash(abs_path, size)[1]
+    
+    key = f"{_HASH_ALGORITHM}:{abs_path}:{mtime_ns}:{size}"
+    entry = FINGERPRINT_CACHE_DIR / hashlib.sha256(key.encode("utf-8")).hexdigest()
+    try:
+        digest = entry.read_text(encoding="ascii")
+        if len(digest) == 64:
+            return digest
+    except OSError:
+        pass
+    
+    _, digest = _content_hash(abs_path, size)
+    try:
+        write_atomic(entry, digest.encode("ascii"))
+        prune(FINGERPRINT_CACHE_DIR, FINGERPRINT_CACHE_MAX_ENTRIES)
+    except OSError:
+        # The cache is an optimization only
+        pass
+    return digest
+
+
+def _cached_hash(path: str, st: os.stat_result) -> str:
+    """Return the _content_hash(path) digest, reusing earlier results while the file is unchanged."""
+    return _memo_hash(os.path.abspath(path), st.st_size, st.st_mtime_ns)
+
+
 def fingerprint(path: str) -> Fingerprint:
     """
     Create a fingerprint for a file.
@@ -47,10 +157,32 @@ def fingerprint(path: str) -> Fingerprint:
         path=path,
         size=st.st_size,
         mtime=st.st_mtime,
-        sha256=_sha256(path)
+        digest=_cached_hash(path, st),
+        algorithm=_HASH_ALGORITHM,
     )
 
 
+# Opt-in pyarrow CSV parsing. Off by default: its type inference differs from
+# the C parser's (dates, NA tokens, mixed-type columns), so frames can change
+PYARROW_CSV_ENV = "FIGMAKER_PYARROW_CSV"
+
+
+def _pyarrow_csv_enabled() -> bool:
+    """Whether the user opted in to pyarrow's CSV parser and it is installed."""
+    return _HAS_PYARROW and os.environ.get(PYARROW_CSV_ENV, "").lower() in ("1", "true", "yes")
+
+
+def _read_csv(path: str, sep: str = ",") -> pd.DataFrame:
+    """Read a delimited file, with pyarrow's multithreaded parser if opted in."""
+    if _pyarrow_csv_enabled():
+        try:
+            return pd.read_csv(path, sep=sep, engine="pyarrow")
+        except Exception:
+            # Files the default parser accepts but pyarrow rejects (e.g. ragged rows)
+            pass
+    return pd.read_csv(path, sep=sep)
+
+
 def load_table(path: str, sheet: Optional[str] = None) -> pd.DataFrame:
     """
     Load a data table from various formats.
@@ -69,13 +201,14 @@ def load_table(path: str, sheet: Optional[str] = None) -> pd.DataFrame:
     ext = path_obj.suffix.lower()
     
     if ext == ".csv":
-        return pd.read_csv(path)
+        return _read_csv(path)
     elif ext in (".tsv", ".txt"):
-        return pd.read_csv(path, sep="\t")
+        return _read_csv(path, sep="\t")
     elif ext in (".xls", ".xlsx"):
-        return pd.read_excel(path, sheet_name=sheet or 0)
+        return pd.read_excel(path, sheet_name=sheet or 0, engine=_EXCEL_ENGINE)
     elif ext == ".parquet":
-        return pd.read_parquet(path)
+        # pyarrow decodes column chunks on multiple threads
+        return pd.read_parquet(path, engine="pyarrow" if _HAS_PYARROW else "auto")
     elif ext == ".json":
         return pd.read_json(path)
     else:
@@ -94,6 +227,67 @@ def save_metadata(meta_path: str, payload: Dict[str, Any]) -> None:
         json.dump(payload, f, indent=2, default=str)
 
 
+class _HashingReader(io.RawIOBase):
+    """
+    Read-only file wrapper that hashes the bytes a decoder pulls through it.
+    
+    Decoders seek (Pillow rewinds after sniffing the header), so only reads
+    that extend the contiguously hashed prefix update the hash; hexdigest()
+    reads whatever was skipped or left unread to finish the digest. The
+    wrapper owns the file: closing it finishes the digest, then closes the file.
+    """
+    
+    def __init__(self, raw):
+        super().__init__()
+        self._raw = raw
+        self._hash = _new_hasher()
+        self._digest: Optional[str] = None
+        self._pos = 0
+        self._hashed = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._pos = self._raw.seek(offset, whence)
+        return self._pos
+    
+    def tell(self) -> int:
+        return self._pos
+    
+    def readinto(self, b) -> int:
+        pos = self._pos
+        n = self._raw.readinto(b) or 0
+        self._pos = pos + n
+        if self._digest is None and pos <= self._hashed < self._pos:
+            with memoryview(b) as mv:
+                self._hash.update(mv[self._hashed - pos:n])
+            self._hashed = self._pos
+        return n
+    
+    def hexdigest(self) -> str:
+        """Finish hashing the remainder of the file and return the digest."""
+        if self._digest is None:
+            # Restore the position afterwards: the decoder may read on (later frames)
+            self._raw.seek(self._hashed)
+            while buf := self._raw.read(_HASH_CHUNK):
+                self._hash.update(buf)
+            self._raw.seek(self._pos)
+            self._digest = self._hash.hexdigest()
+        return self._digest
+    
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                self.hexdigest()
+            finally:
+                self._raw.close()
+        super().close()
+
+
 # Figmaker-specific image loading
 def load_image_with_fingerprint(path: str) -> tuple[Any, Fingerprint]:
     """
@@ -106,10 +300,24 @@ def load_image_with_fingerprint(path: str) -> tuple[Any, Fingerprint]:
         Tuple of (PIL Image, Fingerprint)
     """
     from PIL import Image
+    from PIL import TiffImagePlugin  # noqa: F401  avoids Image.init() for TIFF inputs
     
-    image = Image.open(path)
+    Image.preinit()
+    st = os.stat(path)
+    # Hash the bytes as the decoder reads them instead of reading the file twice
+    reader = _HashingReader(open(path, "rb", buffering=0))
+    try:
+        image = Image.open(io.BufferedReader(reader, _HASH_CHUNK))
+    except Exception:
+        reader.close()
+        raise
+    # The image owns the wrapper as it would a file opened by path: single-frame
+    # files are closed after load(), multi-frame files stay open for seek()
+    image._exclusive_fp = True
     image.load()  # Ensure image data is loaded into memory
-    fp = fingerprint(path)
+    digest = reader.hexdigest()
+    fp = Fingerprint(path=path, size=st.st_size, mtime=st.st_mtime, digest=digest,
+                     algorithm=_HASH_ALGORITHM)
     
     return image, fp
 
@@ -129,16 +337,23 @@ def create_project_fingerprint(panels: list, settings: dict) -> Dict[str, Any]:
     import sys
     from datetime import datetime
     
-    # Create fingerprints for all image files
+    # Create fingerprints for all image files; hashlib releases the GIL, so hash on threads
+    hashed = [
+        panel for panel in panels
+        if 'original_path' in panel and os.path.exists(panel['original_path'])
+    ]
     file_fingerprints = {}
-    for panel in panels:
-        if 'original_path' in panel and os.path.exists(panel['original_path']):
-            try:
-                fp = fingerprint(panel['original_path'])
-                file_fingerprints[panel['name']] = fp.__dict__
-            except (OSError, IOError):
-                # Handle cases where file is no longer accessible
-                file_fingerprints[panel['name']] = {"error": "File not accessible"}
+    if hashed:
+        max_workers = min(8, len(hashed), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(fingerprint, panel['original_path']) for panel in hashed]
+            # Collect in panel order so the output is stable
+            for panel, future in zip(hashed, futures, strict=True):
+                try:
+                    file_fingerprints[panel['name']] = future.result().__dict__
+                except (OSError, IOError):
+                    # Handle cases where file is no longer accessible
+                    file_fingerprints[panel['name']] = {"error": "File not accessible"}
     
     return {
         "timestamp": datetime.now().isoformat(),
@@ -8,12 +8,93 @@ the original Figmaker GUI application.
 from __future__ import annotations
 import matplotlib.pyplot as plt
 from matplotlib.axes import Axes
-import numpy as np
 from PIL import Image, ImageDraw, ImageFont
+from PIL import TiffImagePlugin  # noqa: F401  TIFF is not one of Image.preinit()'s plugins
 from PIL.ImageFont import FreeTypeFont
-from typing import Optional, Dict, Any, List, Tuple, Union
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple, Union, Iterable
+import itertools
 import os
 
+from ..labels import panel_label
+
+# Register BMP/GIF/JPEG/PNG/PPM (plus TIFF above) now, so Image.open never has to
+# fall back to Image.init(), which imports every plugin Pillow ships
+Image.preinit()
+
+_BACKGROUND_COLORS: Dict[str, Optional[Tuple[int, int, int]]] = {
+    "white": (255, 255, 255),
+    "light_gray": (245, 245, 245),
+    "transparent": None
+}
+
+
+# Decoded microscopy images can be hundreds of MB each, so keep only a few
+@lru_cache(maxsize=8)
+def _open_pil(path_key: Tuple[str, int]) -> Image.Image:
+    """
+    Decode an image once per ``(absolute path, st_mtime_ns)`` key.
+    
+    Repeated references to the same file (shared legends, colormaps) share
+    one decoded buffer, so callers must treat the result as read-only.
+    ``_open_pil.cache_clear()`` releases every cached image.
+    """
+    with Image.open(path_key[0]) as image:
+        return image.copy()
+
+
+def open_frames(image_path: str, pages: Iterable[int]) -> Dict[int, Image.Image]:
+    """
+    Decode several frames of a multi-page image (TIFF, GIF) with a single open.
+    
+    Args:
+        image_path: Path to the image file
+        pages: Zero-based frame indices to decode
+        
+    Returns:
+        Dictionary mapping each requested page to its decoded frame
+    """
+    try:
+        frames = {}
+        with Image.open(image_path) as image:
+            for page in sorted(set(pages)):
+                image.seek(page)
+                frames[page] = image.copy()
+        return frames
+    except Exception as e:
+        raise ValueError(f"Could not load image {image_path}: {e}")
+
+
+@lru_cache(maxsize=64)
+def _resolve_label_font(font_family: str, font_size_pt: int, dpi: int) -> Union[FreeTypeFont, ImageFont.ImageFont]:
+    """Find and load a label font once per (family, size, dpi)."""
+    try:
+        font_size_px = int((font_size_pt / 72) * dpi)
+        
+        if font_family == "Default":
+            return ImageFont.load_default()
+        
+        # Try different font file patterns
+        font_patterns = [
+            f"{font_family.lower().replace(' ', '')}.ttf",
+            f"{font_family.lower().replace(' ', '')}bd.ttf",  # Bold variant
+            f"C:/Windows/Fonts/{font_family.replace(' ', '')}.ttf",
+            f"C:/Windows/Fonts/{font_family.lower().replace(' ', '')}.ttf",
+            f"/System/Library/Fonts/{font_family}.ttf",  # macOS
+            f"/usr/share/fonts/truetype/{font_family.lower()}/{font_family.lower()}.ttf",  # Linux
+        ]
+        
+        for pattern in font_patterns:
+            try:
+                return ImageFont.truetype(pattern, size=font_size_px)
+            except (OSError, IOError):
+                continue
+        
+        return ImageFont.load_default()
+        
+    except Exception:
+        return ImageFont.load_default()
+
 
 def draw(ax: Axes, image_path: str, title: Optional[str] = None, **kwargs) -> None:
     """
@@ -26,11 +107,22 @@ def draw(ax: Axes, image_path: str, title: Optional[str] = None, **kwargs) -> No
         ax: Matplotlib axes to draw on
         image_path: Path to the image file
         title: Optional title for the panel
-        **kwargs: Additional arguments (unused for compatibility)
+        **kwargs: Additional arguments; ``page`` selects a frame of a multi-page
+            image and ``dpi`` is the output resolution (default: the figure's)
     """
     try:
-        image = Image.open(image_path)
-        ax.imshow(np.array(image))
+        with Image.open(image_path) as image:
+            image.seek(kwargs.get("page", 0))
+            
+            # Decode no more than the axes can show at the output DPI; libjpeg scales
+            # by 1/2, 1/4 or 1/8 during decode, other formats ignore the draft
+            scale = (kwargs.get("dpi") or ax.figure.dpi) / ax.figure.dpi
+            target = (int(ax.bbox.width * scale), int(ax.bbox.height * scale))
+            if min(target) > 0:
+                image.draft(image.mode, target)
+            
+            # imshow converts the (drafted) image to an array, so the file can close after it
+            ax.imshow(image)
         ax.set_xticks([])
         ax.set_yticks([])
         
@@ -61,15 +153,29 @@ class ImagePanelAssembler:
     def __init__(self):
         self.panels: List[Dict[str, Any]] = []
         self.annotations: List[Dict[str, Any]] = []
+        # Panels may share a cached image, so id() of the image is not unique
+        self._panel_ids = itertools.count()
+        # Last canvas of a reuse_canvas=True assembly, repainted when mode and size match
+        self._canvas: Optional[Image.Image] = None
+        
+    def add_panel(
+        self, image_path: str, name: Optional[str] = None, image: Optional[Image.Image] = None
+    ) -> None:
+        """
+        Add an image panel to the assembly.
         
-    def add_panel(self, image_path: str, name: Optional[str] = None) -> None:
-        """Add an image panel to the assembly."""
+        Args:
+            image_path: Path to the image file
+            name: Panel name (default: the file name)
+            image: Already decoded image for this path, e.g. one frame from open_frames()
+        """
         try:
-            image = Image.open(image_path)
-            image.load()  # Ensure image data is loaded
+            if image is None:
+                abs_path = os.path.abspath(image_path)
+                image = _open_pil((abs_path, os.stat(abs_path).st_mtime_ns))
             
             panel_data = {
-                'id': id(image),
+                'id': next(self._panel_ids),
                 'pil_image': image,
                 'name': name or os.path.basename(image_path),
                 'original_path': image_path
@@ -89,7 +195,8 @@ class ImagePanelAssembler:
         background: str = "white",
         label_style: str = "A, B, C...",
         font_family: str = "Arial",
-        label_font_size: int = 14
+        label_font_size: int = 14,
+        reuse_canvas: bool = False
     ) -> Image.Image:
         """
         Assemble panels into a single figure.
@@ -107,6 +214,9 @@ class ImagePanelAssembler:
             label_style: Panel labeling style
             font_family: Font family for labels
             label_font_size: Font size for labels in points
+            reuse_canvas: Repaint the image returned by the previous call when
+                mode and size match, instead of allocating a new one. Only for
+                callers that are done with the previous figure.
             
         Returns:
             PIL Image containing the assembled figure
@@ -136,7 +246,7 @@ class ImagePanelAssembler:
             scaled_w = col_width_px
             scaled_h = int(img.height * scale)
             
-            layouts.append({'width': scaled_w, 'height': scaled_h, 'image': img})
+            layouts.append({'width': scaled_w, 'height': scaled_h, 'image': img, 'panel': panel_data})
             current_row_max_h = max(current_row_max_h, scaled_h)
             
             # Store row height at end of row or last panel
@@ -158,12 +268,17 @@ class ImagePanelAssembler:
             bg_fill = bg_color
         
         # Create and assemble figure
-        assembled_image = Image.new(mode, (total_width_px, total_height_px), bg_fill)
+        canvas_size = (total_width_px, total_height_px)
+        if reuse_canvas:
+            assembled_image = self._get_canvas(mode, canvas_size, bg_fill)
+        else:
+            assembled_image = Image.new(mode, canvas_size, bg_fill)
         draw = ImageDraw.Draw(assembled_image)
         
         # Position and paste panels
         current_x, current_y = margin_px, margin_px
         row_start_y = margin_px
+        label_origins = []
         
         for i, layout in enumerate(layouts):
             col_idx = i % num_cols
@@ -176,116 +291,109 @@ class ImagePanelAssembler:
             current_x = margin_px + col_idx * (col_width_px + padding_px)
             
             # Resize and paste panel
-            resized_img = layout['image'].resize(
-                (layout['width'], layout['height']), 
-                Image.Resampling.LANCZOS
-            )
-            
-            # Handle transparency
-            if assembled_image.mode == 'RGBA' and resized_img.mode != 'RGBA':
-                resized_img = resized_img.convert('RGBA')
-            
-            if assembled_image.mode == 'RGBA':
-                assembled_image.paste(resized_img, (current_x, row_start_y), resized_img)
-            else:
-                assembled_image.paste(resized_img, (current_x, row_start_y))
-            
-            # Add panel labels
-            self._add_panel_label(
-                draw, i, current_x, row_start_y, dpi, padding_px,
-                label_style, font_family, label_font_size
+            resized_img, mask = self._get_resized_panel(
+                layout['panel'], layout['width'], layout['height'], assembled_image.mode
             )
+            assembled_image.paste(resized_img, (current_x, row_start_y), mask)
+            label_origins.append((current_x, row_start_y))
+        
+        # Add panel labels once everything is pasted
+        self._add_panel_labels(
+            draw, label_origins, dpi, padding_px,
+            label_style, font_family, label_font_size
+        )
         
         return assembled_image
     
+    def _get_canvas(self, mode: str, size: Tuple[int, int], bg_fill: Tuple[int, ...]) -> Image.Image:
+        """Return a background-filled canvas, reusing the previous buffer when mode and size match."""
+        canvas = self._canvas
+        if canvas is not None and canvas.mode == mode and canvas.size == size:
+            canvas.paste(bg_fill, (0, 0) + size)
+        else:
+            canvas = Image.new(mode, size, bg_fill)
+            self._canvas = canvas
+        return canvas
+    
+    def _get_resized_panel(
+        self, panel_data: Dict[str, Any], width: int, height: int, mode: str
+    ) -> Tuple[Image.Image, Optional[Image.Image]]:
+        """
+        Resize a panel for pasting, reusing the previous result for the same size.
+        
+        Panels already at the target size are not resampled. Returns the image
+        and its paste mask: in RGBA figures, panels with real transparency are
+        their own mask; opaque panels get None and are copied straight in.
+        """
+        key = (width, height, mode)
+        cached = panel_data.get('resized')
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+        
+        img = panel_data['pil_image']
+        if img.size == (width, height):
+            resized_img = img
+        else:
+            resized_img = img.resize((width, height), Image.Resampling.LANCZOS)
+        
+        # Handle transparency; a fully opaque alpha channel needs no mask
+        mask = None
+        if mode == 'RGBA' and ('A' in resized_img.getbands() or 'transparency' in resized_img.info):
+            if resized_img.mode != 'RGBA':
+                resized_img = resized_img.convert('RGBA')
+            if resized_img.getextrema()[3] != (255, 255):
+                mask = resized_img
+        
+        panel_data['resized'] = (key, resized_img, mask)
+        return resized_img, mask
+    
     def _get_background_color(self, background: str) -> Optional[Tuple[int, int, int]]:
         """Convert background string to RGB tuple or None for transparent."""
-        bg_map = {
-            "white": (255, 255, 255),
-            "light_gray": (245, 245, 245),
-            "transparent": None
-        }
-        return bg_map.get(background, (255, 255, 255))
+        return _BACKGROUND_COLORS.get(background, (255, 255, 255))
     
-    def _add_panel_label(
+    def _add_panel_labels(
         self,
         draw: ImageDraw.Draw,
-        panel_index: int,
-        x: int,
-        y: int,
+        origins: List[Tuple[int, int]],
         dpi: int,
         padding_px: int,
         label_style: str,
         font_family: str,
         label_font_size: int
     ) -> None:
-        """Add label to a panel."""
-        if label_style == "None":
+        """Add labels to every panel, given each panel's top-left corner."""
+        if label_style == "None" or not origins:
             return
         
-        # Generate label text
-        label_text = self._get_label_text(label_style, panel_index)
-        
-        # Get font
+        # Every label shares one font
         font = self._get_label_font(font_family, label_font_size, dpi)
-        
-        # Position label
-        text_pos_x = x + int(padding_px * 0.3)
-        text_pos_y = y + int(padding_px * 0.3)
-        
-        # Draw label with background
-        bbox = draw.textbbox((text_pos_x, text_pos_y), label_text, font=font)
+        offset = int(padding_px * 0.3)
         bg_padding = int(padding_px * 0.1)
-        bg_bbox = (
-            bbox[0] - bg_padding, bbox[1] - bg_padding,
-            bbox[2] + bg_padding, bbox[3] + bg_padding
-        )
         
-        draw.rectangle(bg_bbox, fill="white", outline="black", width=1)
-        draw.text((text_pos_x, text_pos_y), label_text, fill="black", font=font)
+        for panel_index, (x, y) in enumerate(origins):
+            label_text = self._get_label_text(label_style, panel_index)
+            
+            # Position label
+            text_pos_x = x + offset
+            text_pos_y = y + offset
+            
+            # Draw label with background; font.getbbox measures relative to the origin
+            left, top, right, bottom = font.getbbox(label_text)
+            bg_bbox = (
+                text_pos_x + left - bg_padding, text_pos_y + top - bg_padding,
+                text_pos_x + right + bg_padding, text_pos_y + bottom + bg_padding
+            )
+            
+            draw.rectangle(bg_bbox, fill="white", outline="black", width=1)
+            draw.text((text_pos_x, text_pos_y), label_text, fill="black", font=font)
     
     def _get_label_text(self, label_style: str, panel_index: int) -> str:
         """Generate label text based on style."""
-        if label_style == "A, B, C...":
-            return chr(65 + panel_index)
-        elif label_style == "a, b, c...":
-            return chr(97 + panel_index)
-        elif label_style == "1, 2, 3...":
-            return str(panel_index + 1)
-        elif label_style == "i, ii, iii...":
-            roman_numerals = ["i", "ii", "iii", "iv", "v", "vi", "vii", "viii", "ix", "x"]
-            return roman_numerals[panel_index] if panel_index < len(roman_numerals) else str(panel_index + 1)
-        else:
-            return chr(65 + panel_index)
+        return panel_label(label_style, panel_index)
     
     def _get_label_font(self, font_family: str, font_size_pt: int, dpi: int) -> Union[FreeTypeFont, ImageFont.ImageFont]:
         """Get font for panel labels."""
-        try:
-            font_size_px = int((font_size_pt / 72) * dpi)
-            
-            if font_family == "Default":
-                return ImageFont.load_default()
-            
-            # Try different font file patterns
-            font_patterns = [
-                f"{font_family.lower().replace(' ', '')}.ttf",
-                f"{font_family.lower().replace(' ', '')}bd.ttf",  # Bold variant
-                f"C:/Windows/Fonts/{font_family.replace(' ', '')}.ttf",
-                f"C:/Windows/Fonts/{font_family.lower().replace(' ', '')}.ttf",
-                f"/System/Library/Fonts/{font_family}.ttf",  # macOS
-                f"/usr/share/fonts/truetype/{font_family.lower()}/{font_family.lower()}.ttf",  # Linux
-            ]
-            
-            for pattern in font_patterns:
-                try:
-                    return ImageFont.truetype(pattern, size=font_size_px)
-                except (OSError, IOError):
-                    continue
-            
-            return ImageFont.load_default()
-            
-        except Exception:
-            return ImageFont.load_default()
+        return _resolve_label_font(font_family, font_size_pt, dpi)
     
     def add_annotation(self, text: str, x: int, y: int) -> None:
         """Add a text annotation at the specified position."""
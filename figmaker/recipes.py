@@ -6,6 +6,7 @@ allowing for declarative figure specification and validation.
 """
 
 from __future__ import annotations
+from functools import cached_property
 from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Dict, List, Optional, Any
 
@@ -40,6 +41,11 @@ class Panel(BaseModel):
     kwargs: Dict[str, Any] = Field(default_factory=dict)
     
     model_config = ConfigDict(extra="forbid")
+    
+    @cached_property
+    def transform_dicts(self) -> List[Dict[str, Any]]:
+        """Transforms as plain dicts for apply_pipeline, built once per panel."""
+        return [t.model_dump() for t in self.transforms]
 
 
 class FigureSpec(BaseModel):
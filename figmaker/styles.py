@@ -8,7 +8,7 @@ for scientific publication figures.
 from __future__ import annotations
 import matplotlib as mpl
 from cycler import cycler
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 
 # Colorblind-safe palettes
@@ -130,6 +130,16 @@ JOURNALS: Dict[str, Dict[str, Any]] = {
 }
 
 
+# Full rcParams for each journal, merged once at import
+_MERGED: Dict[str, Dict[str, Any]] = {
+    name: {**RC_BASE, **overrides} for name, overrides in JOURNALS.items()
+}
+
+# Style last applied and its validated values, to skip re-validating every key
+_CURRENT: Optional[str] = None
+_CURRENT_RC: Dict[str, Any] = {}
+
+
 def apply_style(name: str) -> None:
     """
     Apply a journal-specific style to matplotlib.
@@ -137,18 +147,22 @@ def apply_style(name: str) -> None:
     Args:
         name: Journal name ('nature', 'science', 'cell', 'default')
     """
+    global _CURRENT, _CURRENT_RC
+    
     if name not in JOURNALS:
         raise ValueError(f"Unknown style '{name}'. Available: {list(JOURNALS.keys())}")
     
-    # Start with base configuration
-    rc = RC_BASE.copy()
-    
-    # Apply journal-specific overrides
-    journal_rc = JOURNALS.get(name, {})
-    rc.update(journal_rc)
+    # Skip when this style is still in effect (rcParams may have been changed since)
+    if name == _CURRENT and all(
+        dict.__getitem__(mpl.rcParams, key) == value for key, value in _CURRENT_RC.items()
+    ):
+        return
     
     # Update matplotlib
+    rc = _MERGED[name]
     mpl.rcParams.update(rc)
+    _CURRENT = name
+    _CURRENT_RC = {key: dict.__getitem__(mpl.rcParams, key) for key in rc}
 
 
 def get_palette(name: str) -> List[str]:
@@ -8,9 +8,53 @@ used in scientific figure generation.
 from __future__ import annotations
 import numpy as np
 import pandas as pd
+import functools
 from typing import Dict, Any, List, Callable
 
+# Transforms return new frames without eager copies; copy-on-write keeps the
+# caller's data from being modified through them. It is always on from pandas
+# 3.0; on older versions it is enabled only while a transform runs
+_ALWAYS_COW = int(pd.__version__.split(".")[0]) >= 3
 
+
+def _copy_on_write(fn: Callable) -> Callable:
+    """
+    Run a transform with copy-on-write, without changing the global pandas option.
+    
+    On pandas < 3 the outermost call returns a deep copy of its result, so only
+    steps run inside apply_pipeline avoid copying; a transform called on its
+    own still copies once, as it did before copy-on-write.
+    """
+    @functools.wraps(fn)
+    def wrapper(df: pd.DataFrame, *args, **kwargs) -> pd.DataFrame:
+        if _ALWAYS_COW or pd.get_option("mode.copy_on_write") is True:
+            return fn(df, *args, **kwargs)
+        with pd.option_context("mode.copy_on_write", True):
+            result = fn(df, *args, **kwargs)
+        # Outside the context writes go in place, so the result must not share
+        # buffers with the caller's frame; apply_pipeline pays this once, not per step
+        return result.copy()
+    return wrapper
+
+try:
+    import numexpr  # noqa: F401  Optional: compiled, cache-blocked expression evaluation
+    _EVAL_ENGINE = "numexpr"
+except ImportError:
+    _EVAL_ENGINE = "python"
+
+
+def _evaluate(method: Callable, expr: str):
+    """Run ``df.eval``/``df.query`` with numexpr if available, else the python engine."""
+    if _EVAL_ENGINE == "numexpr":
+        try:
+            return method(expr, engine="numexpr")
+        except Exception:
+            # e.g. string methods or functions numexpr does not support
+            pass
+    return method(expr, engine="python")
+
+
+@_copy_on_write
 def filter_data(df: pd.DataFrame, expr: str) -> pd.DataFrame:
     """
     Filter DataFrame using a query expression.
@@ -22,9 +66,10 @@ def filter_data(df: pd.DataFrame, expr: str) -> pd.DataFrame:
     Returns:
         Filtered DataFrame
     """
-    return df.query(expr, engine="python")
+    return _evaluate(df.query, expr)
 
 
+@_copy_on_write
 def select_columns(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
     """
     Select specific columns from DataFrame.
@@ -39,6 +84,7 @@ def select_columns(df: pd.DataFrame, cols: List[str]) -> pd.DataFrame:
     return df[cols]
 
 
+@_copy_on_write
 def mutate(df: pd.DataFrame, **newcols) -> pd.DataFrame:
     """
     Add new columns to DataFrame using expressions.
@@ -51,12 +97,13 @@ def mutate(df: pd.DataFrame, **newcols) -> pd.DataFrame:
     Returns:
         DataFrame with new columns added
     """
-    out = df.copy()
+    out = df
     for k, expr in newcols.items():
-        out[k] = pd.eval(expr, engine="python", target=out)
+        out = out.assign(**{k: _evaluate(out.eval, expr)})
     return out
 
 
+@_copy_on_write
 def p_adjust_bh(df: pd.DataFrame, pcol: str, out: str = "p_adj") -> pd.DataFrame:
     """
     Apply Benjamini-Hochberg multiple testing correction.
@@ -77,31 +124,25 @@ def p_adjust_bh(df: pd.DataFrame, pcol: str, out: str = "p_adj") -> pd.DataFrame
     
     if len(p_clean) == 0:
         # All NaN values
-        df = df.copy()
-        df[out] = np.nan
-        return df
-    
-    # BH correction
-    order = np.argsort(p_clean)[::-1]  # Descending order
-    ranks = np.empty_like(order)
-    ranks[order] = np.arange(1, len(p_clean) + 1)
+        return df.assign(**{out: np.nan})
     
-    # Calculate adjusted p-values
-    adj_clean = np.minimum(1.0, p_clean * len(p_clean) / ranks)
+    # BH correction: walk p-values from largest to smallest (rank n down to 1)
+    n = len(p_clean)
+    order = np.argsort(p_clean)[::-1]
+    scaled = p_clean[order] * n / np.arange(n, 0, -1)
     
-    # Enforce monotonicity (adjusted p-values should be non-decreasing)
-    for i in range(len(adj_clean) - 1, 0, -1):
-        adj_clean[i - 1] = max(adj_clean[i - 1], adj_clean[i])
+    # Enforce monotonicity with a running minimum from the largest p-value down
+    adj_clean = np.empty(n)
+    adj_clean[order] = np.minimum(np.minimum.accumulate(scaled), 1.0)
     
     # Put back in original array with NaN values
     adj = np.full_like(p, np.nan)
     adj[mask] = adj_clean
     
-    df = df.copy()
-    df[out] = adj
-    return df
+    return df.assign(**{out: adj})
 
 
+@_copy_on_write
 def log2fc(df: pd.DataFrame, num: str, den: str, out: str = "log2fc", eps: float = 1e-9) -> pd.DataFrame:
     """
     Calculate log2 fold change.
@@ -116,11 +157,18 @@ def log2fc(df: pd.DataFrame, num: str, den: str, out: str = "log2fc", eps: float
     Returns:
         DataFrame with log2 fold change column
     """
-    df = df.copy()
-    df[out] = np.log2((df[num] + eps) / (df[den] + eps))
-    return df
+    # Work on plain arrays and reuse the numerator buffer for the ratio and its log
+    ratio = np.add(df[num].to_numpy(dtype=np.float64), eps)
+    np.divide(ratio, np.add(df[den].to_numpy(dtype=np.float64), eps), out=ratio)
+    np.log2(ratio, out=ratio)
+    return df.assign(**{out: ratio})
 
 
+_SIGNIFICANCE_EDGES = np.array([0.001, 0.01, 0.05])
+_SIGNIFICANCE_LABELS = np.array(["***", "**", "*", "ns"], dtype=object)
+
+
+@_copy_on_write
 def add_significance_labels(df: pd.DataFrame, pcol: str, out: str = "significance") -> pd.DataFrame:
     """
     Add significance level labels based on p-values.
@@ -133,19 +181,10 @@ def add_significance_labels(df: pd.DataFrame, pcol: str, out: str = "significanc
     Returns:
         DataFrame with significance labels
     """
-    df = df.copy()
-    
-    conditions = [
-        df[pcol] < 0.001,
-        df[pcol] < 0.01,
-        df[pcol] < 0.05,
-        df[pcol] >= 0.05
-    ]
-    
-    choices = ["***", "**", "*", "ns"]
-    
-    df[out] = np.select(conditions, choices, default="ns")
-    return df
+    # One binary search per value; p == edge falls in the less significant bin and
+    # NaN sorts past every edge, so both end up "ns"
+    idx = np.searchsorted(_SIGNIFICANCE_EDGES, df[pcol].to_numpy(dtype=float), side="right")
+    return df.assign(**{out: _SIGNIFICANCE_LABELS[idx]})
 
 
 # Registry of available transforms
@@ -159,6 +198,7 @@ TRANSFORM_REGISTRY: Dict[str, Callable] = {
 }
 
 
+@_copy_on_write
 def apply_pipeline(df: pd.DataFrame, steps: List[Dict[str, Any]]) -> pd.DataFrame:
     """
     Apply a series of transformation steps to a DataFrame.
@@ -173,7 +213,8 @@ def apply_pipeline(df: pd.DataFrame, steps: List[Dict[str, Any]]) -> pd.DataFram
     Raises:
         ValueError: If transformation operation is not recognized
     """
-    result = df.copy()
+    # Shallow copy: shares data until written, but is never the caller's object
+    result = df.copy(deep=False)
     
     for step in steps:
         op = step["op"]
@@ -0,0 +1,56 @@
+"""Shared pytest configuration for the Figmaker test suite."""
+
+import os
+import sys
+import types
+
+import pytest
+
+# Ensure repository root is on sys.path so tests can import Figmaker
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+# Provide a minimal stub for customtkinter to allow importing Figmaker in CI/headless.
+# conftest.py is imported before any test module is collected
+if 'customtkinter' not in sys.modules:
+    sys.modules['customtkinter'] = types.SimpleNamespace(
+        CTk=object,
+        CTkFrame=object,
+        CTkLabel=object,
+        CTkButton=object,
+        CTkEntry=object,
+        CTkOptionMenu=object,
+        CTkScrollableFrame=object,
+        CTkCanvas=object,
+        set_appearance_mode=lambda m: None,
+        set_default_color_theme=lambda t: None,
+        CTkFont=lambda **k: None
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _mpl_agg():
+    """Render with the headless Agg backend for the whole session."""
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _close_figures():
+    """Close figures a test leaves open so they do not pile up across the suite."""
+    yield
+    import matplotlib.pyplot as plt
+    plt.close("all")
+
+
+@pytest.fixture(autouse=True)
+def _isolated_caches(tmp_path, monkeypatch):
+    """Point the on-disk caches at a per-test directory instead of ~/.cache."""
+    from figmaker import loader, _recipe_cache
+    monkeypatch.setattr(loader, "FINGERPRINT_CACHE_DIR", tmp_path / "cache" / "fingerprints")
+    monkeypatch.setattr(_recipe_cache, "CACHE_DIR", tmp_path / "cache")
+    monkeypatch.delenv(loader.FINGERPRINT_CACHE_ENV, raising=False)
+    monkeypatch.delenv(loader.PYARROW_CSV_ENV, raising=False)
+    loader._memo_hash.cache_clear()
@@ -1,35 +1,70 @@
-import io
+import copy
+import functools
+import json
 import os
-import sys
 from PIL import Image
 import pytest
 
-# Ensure repository root is on sys.path so tests can import Figmaker
-ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-if ROOT not in sys.path:
-    sys.path.insert(0, ROOT)
-
-# Provide a minimal stub for customtkinter to allow importing Figmaker in CI/headless
-import types
-if 'customtkinter' not in sys.modules:
-    fake_ctk = types.SimpleNamespace(
-        CTk=object,
-        CTkFrame=object,
-        CTkLabel=object,
-        CTkButton=object,
-        CTkEntry=object,
-        CTkOptionMenu=object,
-        CTkScrollableFrame=object,
-        CTkCanvas=object,
-        set_appearance_mode=lambda m: None,
-        set_default_color_theme=lambda t: None,
-        CTkFont=lambda **k: None
-    )
-    sys.modules['customtkinter'] = fake_ctk
-
+# conftest.py puts the repository root on sys.path and stubs customtkinter
 from Figmaker import FigureAssemblerApp
 
 
+class GetStub:
+    """Stands in for a Tk variable, entry or button: get() returns the last value set or inserted."""
+    __slots__ = ('_v',)
+
+    def __init__(self, v=None):
+        self._v = v
+
+    def get(self):
+        return self._v
+
+    def set(self, v):
+        self._v = v
+
+    def delete(self, *args, **kwargs):
+        pass
+
+    def insert(self, index, value):
+        # Callers always delete(0, 'end') first, so inserting replaces the value
+        self._v = value
+
+    def configure(self, *args, **kwargs):
+        pass
+
+
+class FakeTree:
+    """Stands in for the panel ttk.Treeview: rows keyed by iid, in insertion order."""
+
+    def __init__(self):
+        self.rows = {}
+        self._selection = ()
+
+    def selection(self):
+        return self._selection
+
+    def selection_set(self, items):
+        self._selection = tuple(items)
+
+    def get_children(self):
+        return tuple(self.rows)
+
+    def delete(self, *iids):
+        # Like Tk, deleted rows also leave the selection
+        for iid in iids:
+            del self.rows[iid]
+        self._selection = tuple(iid for iid in self._selection if iid not in iids)
+
+    def insert(self, parent, index, iid, values):
+        self.rows[iid] = values
+
+    def exists(self, iid):
+        return iid in self.rows
+
+    def see(self, iid):
+        pass
+
+
 class DummyApp(FigureAssemblerApp):
     """Subclass the app to avoid initializing the full CTk GUI loop for tests.
     We override methods that create windows to keep tests headless.
@@ -40,112 +75,449 @@ class DummyApp(FigureAssemblerApp):
         # by calling object.__init__ and then manually setting fields.
         object.__init__(self)
         # Minimal attributes used by methods under test
-        import io
-        import os
-        from PIL import Image
-        import pytest
-
-        from Figmaker import FigureAssemblerApp
-
-
-        class DummyApp(FigureAssemblerApp):
-            """Subclass the app to avoid initializing the full CTk GUI loop for tests.
-            We override methods that create windows to keep tests headless.
-            """
-            def __init__(self):
-                # Avoid calling CTk.__init__ to prevent GUI initialization
-                # Instead, set up only the attributes used by the tested methods
-                # by calling object.__init__ and then manually setting fields.
-                object.__init__(self)
-                # Minimal attributes used by methods under test
-                self.pub_settings = {
-                    'label_font_size': 14
-                }
-                self.font_var = type('X', (), {'get': lambda self: 'Default'})()
-                self.dpi_var = type('X', (), {'get': lambda self: '300'})()
-                self.bg_var = type('X', (), {'get': lambda self: 'White'})()
-                self.font_size_entry = type('E', (), {'get': lambda self: '12'})()
-                self.target_width_entry = type('E', (), {'get': lambda self: '7.0', 'delete': lambda *a, **k: None, 'insert': lambda *a, **k: None})()
-                self.num_cols_entry = type('E', (), {'get': lambda self: '2'})()
-                self.padding_entry = type('E', (), {'get': lambda self: '8'})()
-                self.margin_entry = type('E', (), {'get': lambda self: '12'})()
-                self.label_style_var = type('X', (), {'get': lambda self: 'A, B, C...'})()
-                self.panels = []
-                self.annotations = []
-                self.canvas = None
-                self.canvas_frame = None
-                self.canvas_placeholder = None
-                self.canvas_image = None
-                self.export_button = type('E', (), {'configure': lambda *a, **k: None})()
-
-            def update_panel_list(self):
-                pass
-
-    def display_image(self, img):
-        # For tests, don't require a real canvas — just store the image
-    self._last_displayed = pil_image
-
-
-        def make_test_image(color=(200, 100, 50), size=(100, 80)):
-            img = Image.new('RGB', size, color=color)
-            return img
-
-
-        def test_get_background_color_white():
-            app = DummyApp()
-            app.bg_var = type('X', (), {'get': lambda self: 'White'})()
-            assert app._get_background_color() == 'white'
-
-
-        def test_get_background_color_transparent():
-            app = DummyApp()
-            app.bg_var = type('X', (), {'get': lambda self: 'Transparent'})()
-            assert app._get_background_color() is None
-
-
-        def test_assemble_figure_basic_layout():
-            app = DummyApp()
-            # Create two panels and set UI-like fields
-            img1 = make_test_image(size=(200, 100))
-            img2 = make_test_image(size=(50, 150))
-            app.panels = [
-                {'id': 1, 'pil_image': img1, 'name': 'img1', 'original_path': ''},
-                {'id': 2, 'pil_image': img2, 'name': 'img2', 'original_path': ''}
-            ]
-
-            # Settings
-            app.target_width_entry = type('E', (), {'get': lambda self: '4.0'})()
-            app.dpi_var = type('X', (), {'get': lambda self: '150'})()
-            app.num_cols_entry = type('E', (), {'get': lambda self: '2'})()
-            app.padding_entry = type('E', (), {'get': lambda self: '10'})()
-            app.margin_entry = type('E', (), {'get': lambda self: '12'})()
-            app.bg_var = type('X', (), {'get': lambda self: 'White'})()
-
-            # Call assemble
-            app.assemble_figure()
-
-            # Check assembled image exists and has expected width
-            assert hasattr(app, 'assembled_image') and app.assembled_image is not None
-            dpi = int(app.dpi_var.get())
-            expected_width = int(float(app.target_width_entry.get()) * dpi)
-            assert app.assembled_image.width == expected_width
-
-
-        def test_assemble_with_transparent_bg():
-            app = DummyApp()
-            img1 = make_test_image(size=(120, 80))
-            app.panels = [{'id': 1, 'pil_image': img1, 'name': 'img1', 'original_path': ''}]
-
-            app.target_width_entry = type('E', (), {'get': lambda self: '2.0'})()
-            app.dpi_var = type('X', (), {'get': lambda self: '100'})()
-            app.num_cols_entry = type('E', (), {'get': lambda self: '1'})()
-            app.padding_entry = type('E', (), {'get': lambda self: '5'})()
-            app.margin_entry = type('E', (), {'get': lambda self: '4'})()
-            app.bg_var = type('X', (), {'get': lambda self: 'Transparent'})()
-
-            app.assemble_figure()
+        self.pub_settings = {
+            'label_font_size': 14
+        }
+        self.available_fonts = ['Default']
+        self.canvas = None
+        self.canvas_frame = None
+        self.canvas_placeholder = None
+        self.canvas_image = None
+        self.export_button = GetStub()
+        self.reset_state()
+
+    def reset_state(self):
+        """Give this instance its own default settings, empty panel list and caches."""
+        self.font_var = GetStub('Default')
+        self.dpi_var = GetStub('300')
+        self.bg_var = GetStub('White')
+        self.font_size_entry = GetStub('12')
+        self.target_width_entry = GetStub('7.0')
+        self.num_cols_entry = GetStub('2')
+        self.padding_entry = GetStub('8')
+        self.margin_entry = GetStub('12')
+        self.label_style_var = GetStub('A, B, C...')
+        self.fast_export_var = GetStub(True)
+        self.export_format_var = GetStub('PNG')
+        self.panels = []
+        self._next_panel_id = 0
+        self.annotations = []
+        self.assembled_image = None
+        self._preview_source = None
+        self._preview_cache = {}
+        self._canvas_layout = None
+        self._display_after_id = None
+        self._resize_cache = {}
+        self._image_cache = {}
+        self._canvas_buffer = None
+        self._label_tiles = {}
+        self._annotation_layer = None
+
+    def update_panel_list(self):
+        pass
+
+    def display_image(self, pil_image, annotations=None):
+        # For tests, don't require a real canvas — just store what would be shown
+        self._last_displayed = pil_image
+        self._last_annotations = annotations
+
+
+@pytest.fixture(scope="module")
+def dummy_app_template():
+    """Build the stubbed app once per module."""
+    return DummyApp()
+
+
+@pytest.fixture
+def dummy_app(dummy_app_template, monkeypatch):
+    """A shallow copy of the template with fresh state; dialogs are silenced."""
+    for name in ("showinfo", "showwarning", "showerror"):
+        monkeypatch.setattr(f"Figmaker.messagebox.{name}", lambda *a, **k: None)
+    app = copy.copy(dummy_app_template)
+    app.reset_state()
+    return app
+
+
+@functools.lru_cache(maxsize=16)
+def _solid_image(size, color):
+    # Shared by every test asking for the same size and color; treat as read-only
+    return Image.new('RGB', size, color=color)
+
+
+def make_test_image(color=(200, 100, 50), size=(100, 80)):
+    return _solid_image(tuple(size), tuple(color))
+
+
+def test_get_background_color_white(dummy_app):
+    dummy_app.bg_var = GetStub('White')
+    assert dummy_app._get_background_color() == 'white'
+
+
+def test_get_background_color_transparent(dummy_app):
+    dummy_app.bg_var = GetStub('Transparent')
+    assert dummy_app._get_background_color() is None
+
+
+def test_assemble_figure_basic_layout(dummy_app):
+    app = dummy_app
+    # Create two panels and set UI-like fields
+    img1 = make_test_image(size=(200, 100))
+    img2 = make_test_image(size=(50, 150))
+    app.panels = [
+        {'id': 1, 'pil_image': img1, 'name': 'img1', 'original_path': ''},
+        {'id': 2, 'pil_image': img2, 'name': 'img2', 'original_path': ''}
+    ]
+
+    # Settings
+    app.target_width_entry = GetStub('4.0')
+    app.dpi_var = GetStub('150')
+    app.num_cols_entry = GetStub('2')
+    app.padding_entry = GetStub('10')
+    app.margin_entry = GetStub('12')
+    app.bg_var = GetStub('White')
+
+    # Call assemble
+    app.assemble_figure()
+
+    # Check assembled image exists and has expected width
+    assert hasattr(app, 'assembled_image') and app.assembled_image is not None
+    dpi = int(app.dpi_var.get())
+    expected_width = int(float(app.target_width_entry.get()) * dpi)
+    assert app.assembled_image.width == expected_width
+
+
+def test_assemble_with_transparent_bg(dummy_app):
+    app = dummy_app
+    img1 = make_test_image(size=(120, 80))
+    app.panels = [{'id': 1, 'pil_image': img1, 'name': 'img1', 'original_path': ''}]
+
+    app.target_width_entry = GetStub('2.0')
+    app.dpi_var = GetStub('100')
+    app.num_cols_entry = GetStub('1')
+    app.padding_entry = GetStub('5')
+    app.margin_entry = GetStub('4')
+    app.bg_var = GetStub('Transparent')
+
+    app.assemble_figure()
 
     assert app.assembled_image is not None
     assert app.assembled_image.mode == 'RGBA'
 
-*** End Patch
\ No newline at end of file
+
+def test_preview_base_reused_until_reassembly(dummy_app):
+    app = dummy_app
+    app.panels = [{'id': 1, 'pil_image': make_test_image(size=(120, 80)), 'name': 'img1', 'original_path': ''}]
+    app.assemble_figure()
+    
+    nearest = Image.Resampling.NEAREST
+    base = app._get_preview_base(app.assembled_image, (60, 40), nearest)
+    assert app._get_preview_base(app.assembled_image, (60, 40), nearest) is base
+    assert app._get_preview_base(app.assembled_image, (30, 20), nearest) is not base
+    
+    # Reassembly may redraw the same canvas buffer in place, so the preview is rebuilt
+    app.assemble_figure()
+    assert app._get_preview_base(app.assembled_image, (60, 40), nearest) is not base
+
+
+def test_annotations_flattened_at_full_resolution(dummy_app):
+    app = dummy_app
+    app.panels = [{'id': 1, 'pil_image': make_test_image(color=(255, 255, 255), size=(120, 80)), 'name': 'img1', 'original_path': ''}]
+    app.assemble_figure()
+    assert app._flatten_annotations(app.assembled_image) is app.assembled_image
+    
+    clean = app.assembled_image.tobytes()
+    app.annotations = [{'text': 'Note', 'x': 40, 'y': 40}]
+    flattened = app._flatten_annotations(app.assembled_image)
+    assert flattened.size == app.assembled_image.size
+    assert flattened.tobytes() != clean
+    assert app.assembled_image.tobytes() == clean
+
+
+def test_annotation_overlay_draws_only_new_annotations(dummy_app, monkeypatch):
+    app = dummy_app
+    app.annotations = [{'text': 'A', 'x': 10, 'y': 10}]
+    overlay = app._build_annotation_overlay((100, 60), app.annotations)
+    first = overlay.tobytes()
+    
+    drawn = []
+    draw = app._annotation_layer[4]
+    draw_text = draw.text
+    monkeypatch.setattr(draw, "text", lambda xy, text, **k: drawn.append(text) or draw_text(xy, text, **k))
+    app.annotations.append({'text': 'B', 'x': 50, 'y': 10})
+    assert app._build_annotation_overlay((100, 60), app.annotations) is overlay
+    assert drawn == ['B']
+    
+    # Removing an annotation clears the reused layer before redrawing the rest
+    app.annotations = app.annotations[:1]
+    assert app._build_annotation_overlay((100, 60), app.annotations).tobytes() == first
+    assert app._build_annotation_overlay((80, 60), app.annotations) is not overlay
+
+
+def write_project(tmp_path, panel_paths, annotations=(), settings=None):
+    """Write a project file listing panel_paths and return its path."""
+    project_path = tmp_path / "project.json"
+    project_path.write_text(json.dumps({
+        'panels': [{'name': os.path.basename(path), 'path': str(path)} for path in panel_paths],
+        'settings': settings or {},
+        'annotations': list(annotations),
+    }))
+    return project_path
+
+
+def test_load_project_redraws_loaded_annotations(dummy_app, tmp_path, monkeypatch):
+    app = dummy_app
+    app.panels = [{'id': 1, 'pil_image': make_test_image(size=(120, 80)), 'name': 'img1', 'original_path': ''}]
+    app.assemble_figure()
+    
+    panel_path = tmp_path / "panel.png"
+    make_test_image(size=(120, 80)).save(panel_path)
+    annotations = [{'text': 'Loaded', 'x': 10, 'y': 20}]
+    project_path = write_project(tmp_path, [panel_path], annotations)
+    monkeypatch.setattr("Figmaker.filedialog.askopenfilename", lambda **k: str(project_path))
+    
+    app.load_project()
+    assert app.annotations == annotations
+    # The preview is redrawn from the loaded list, the same one export flattens
+    assert app._last_annotations is app.annotations
+
+
+def test_load_project_decodes_each_file_once(dummy_app, tmp_path, monkeypatch):
+    app = dummy_app
+    panel_path = tmp_path / "panel.png"
+    make_test_image(size=(120, 80)).save(panel_path)
+    project_path = write_project(tmp_path, [panel_path, panel_path])
+    monkeypatch.setattr("Figmaker.filedialog.askopenfilename", lambda **k: str(project_path))
+    
+    opened = []
+    open_panel_image = app._open_panel_image
+    def counting_open(path, max_target_w):
+        opened.append(path)
+        return open_panel_image(path, max_target_w)
+    monkeypatch.setattr(app, "_open_panel_image", counting_open)
+    
+    # Panels are decoded lazily, on first assemble, and the shared file only once
+    app.load_project()
+    assert len(app.panels) == 2 and opened == []
+    app.assemble_figure()
+    assert len(opened) == 1
+    
+    # Reopening the project reuses the session's decoded image
+    app.load_project()
+    app.assemble_figure()
+    assert len(opened) == 1
+
+
+@pytest.mark.parametrize("style", ["A, B, C...", "i, ii, iii..."])
+def test_gui_labels_match_shared_labels(dummy_app, style):
+    from figmaker.labels import panel_labels
+    
+    app = dummy_app
+    app.label_style_var = GetStub(style)
+    app.num_cols_entry = GetStub('7')
+    img = make_test_image(size=(40, 30))
+    app.panels = [{'id': i, 'pil_image': img, 'name': f'img{i}', 'original_path': ''} for i in range(28)]
+    app.assemble_figure()
+    
+    assert {key[0] for key in app._label_tiles} == set(panel_labels(style, 28))
+
+
+def test_listed_fonts_load_from_their_files():
+    from Figmaker import _installed_font_files, _load_truetype
+    
+    # matplotlib always ships DejaVu Sans, under a file name unlike "dejavusans.ttf"
+    files = _installed_font_files()['DejaVu Sans']
+    assert _load_truetype('DejaVu Sans', 20).path == files['regular']
+    # Labels ask for bold_variant, but it is only a fallback for a missing regular face
+    assert _load_truetype('DejaVu Sans', 20, bold_variant=True).path == files['regular']
+
+
+def test_lazy_panel_image_loads_on_demand(tmp_path):
+    from Figmaker import LazyPanelImage
+    
+    path = tmp_path / "panel.png"
+    make_test_image(size=(64, 48)).save(path)
+    image = LazyPanelImage(str(path))
+    assert (image.size, image.format, image.is_loaded) == ((64, 48), 'PNG', False)
+    
+    decoded = image.load()
+    assert image.is_loaded and decoded.size == (64, 48)
+    assert image.load() is decoded is image.pil_image
+
+
+def test_gui_layout_matches_assembler(dummy_app):
+    from figmaker.plots.image_panel import ImagePanelAssembler
+    
+    # 106 * (983 / 106) is just below 983 in floating point
+    image = make_test_image(size=(106, 106))
+    app = dummy_app
+    app.panels = [{'id': 1, 'pil_image': image, 'name': 'square', 'original_path': ''}]
+    app.assemble_figure()
+    
+    assembler = ImagePanelAssembler()
+    assembler.add_panel("square.png", image=image)
+    assert app.assembled_image.size == assembler.assemble_figure(7.0, 300, 2, 8, 12, label_style="None").size
+
+
+def save_panels(tmp_path, count, size=(120, 80)):
+    """Write count distinct PNG panels and return their paths."""
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"panel_{i}.png"
+        make_test_image(color=(40 * i, 100, 50), size=size).save(path)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_save_load_project_round_trip(dummy_app, dummy_app_template, tmp_path, monkeypatch, use_orjson):
+    import Figmaker
+    if not use_orjson:
+        monkeypatch.setattr(Figmaker, "orjson", None)
+    elif Figmaker.orjson is None:
+        pytest.skip("orjson is not installed")
+    
+    app = dummy_app
+    app.panels = [
+        {'id': i, 'pil_image': Image.open(path), 'name': path.name, 'original_path': str(path)}
+        for i, path in enumerate(save_panels(tmp_path, 2))
+    ]
+    app.dpi_var = GetStub('600')
+    app.num_cols_entry = GetStub('1')
+    app.label_style_var = GetStub('i, ii, iii...')
+    app.annotations = [{'text': 'Note', 'x': 3, 'y': 4}]
+    project_path = tmp_path / "project.json"
+    monkeypatch.setattr("Figmaker.filedialog.asksaveasfilename", lambda **k: str(project_path))
+    monkeypatch.setattr("Figmaker.filedialog.askopenfilename", lambda **k: str(project_path))
+    app.save_project()
+    
+    # Load into a second app with default settings
+    loaded = copy.copy(dummy_app_template)
+    loaded.reset_state()
+    loaded.load_project()
+    assert [(p['name'], p['original_path']) for p in loaded.panels] == [(p['name'], p['original_path']) for p in app.panels]
+    assert [p['pil_image'].size for p in loaded.panels] == [(120, 80)] * 2
+    assert (loaded.dpi_var.get(), loaded.num_cols_entry.get(), loaded.label_style_var.get()) == ('600', '1', 'i, ii, iii...')
+    assert loaded.annotations == app.annotations
+
+
+def test_missing_panels_reported_in_one_dialog(dummy_app, tmp_path, monkeypatch):
+    app = dummy_app
+    present = save_panels(tmp_path, 1)
+    missing = [tmp_path / "gone_1.png", tmp_path / "gone_2.png"]
+    project_path = write_project(tmp_path, missing[:1] + present + missing[1:])
+    monkeypatch.setattr("Figmaker.filedialog.askopenfilename", lambda **k: str(project_path))
+    warnings = []
+    monkeypatch.setattr("Figmaker.messagebox.showwarning", lambda title, message: warnings.append(message))
+    
+    app.load_project()
+    assert [p['original_path'] for p in app.panels] == [str(present[0])]
+    assert len(warnings) == 1
+    assert all(str(path) in warnings[0] for path in missing)
+
+
+def test_jpeg_panels_reopened_only_for_draft_reduction(dummy_app, tmp_path, monkeypatch):
+    app = dummy_app
+    path = tmp_path / "panel.jpg"
+    make_test_image(size=(400, 200)).save(path)
+    with Image.open(path) as image:
+        image.load()
+    panel = {'id': 0, 'pil_image': image, 'name': 'panel.jpg', 'original_path': str(path)}
+    opened = []
+    image_open = Image.open
+    monkeypatch.setattr("Figmaker.Image.open", lambda *a, **k: opened.append(a[0]) or image_open(*a, **k))
+    
+    # Draft reduces in 2x steps, so a target over half the decoded size uses the copy in memory
+    assert app._get_resized_panel(panel, 300, 150, 'RGB').size == (300, 150)
+    assert opened == []
+    assert app._get_resized_panel(panel, 100, 50, 'RGB').size == (100, 50)
+    assert opened == [str(path)]
+
+
+def test_resize_cache_reused_and_invalidated_on_delete(dummy_app):
+    app = dummy_app
+    app.panels = [
+        {'id': i, 'pil_image': make_test_image(size=(120 + i, 80)), 'name': f'img{i}', 'original_path': ''}
+        for i in range(2)
+    ]
+    app.assemble_figure()
+    cached = dict(app._resize_cache)
+    assert {key[0] for key in cached} == {0, 1}
+    
+    # Reassembling at the same settings reuses every resized panel
+    app.assemble_figure()
+    assert all(app._resize_cache[key] is image for key, image in cached.items())
+    
+    # Deleting a panel drops only its own entries
+    app.delete_panel(0)
+    assert {key[0] for key in app._resize_cache} == {1}
+    
+    # A new column width is a new entry, not a stale hit
+    app.num_cols_entry = GetStub('1')
+    app.assemble_figure()
+    assert len(app._resize_cache) == 2
+
+
+def test_treeview_move_and_delete_keep_selection(dummy_app, monkeypatch):
+    app = dummy_app
+    app.panel_tree = FakeTree()
+    monkeypatch.setattr(app, "update_panel_list", functools.partial(FigureAssemblerApp.update_panel_list, app))
+    image = make_test_image(size=(30, 20))
+    app.panels = [{'id': app._allocate_panel_id(), 'pil_image': image, 'name': name, 'original_path': ''} for name in 'abc']
+    app.update_panel_list()
+    assert [values[0] for values in app.panel_tree.rows.values()] == ['1. a', '2. b', '3. c']
+    
+    # The selection follows the moved panel, which is tracked by ID, not by row
+    app.panel_tree.selection_set(['0'])
+    app.move_selected_panel(1)
+    assert [p['name'] for p in app.panels] == ['b', 'a', 'c']
+    assert app.panel_tree.selection() == ('0',)
+    app.move_selected_panel(-1)
+    app.move_selected_panel(-1)  # Already first: no-op
+    assert [p['name'] for p in app.panels] == ['a', 'b', 'c']
+    
+    app.panel_tree.selection_set(['1'])
+    app.delete_selected_panel()
+    assert [p['name'] for p in app.panels] == ['a', 'c']
+    assert app.panel_tree.get_children() == ('0', '2')
+    assert app.panel_tree.selection() == ()
+
+
+def test_select_files_reuses_decoded_images(dummy_app, tmp_path, monkeypatch):
+    app = dummy_app
+    paths = [str(path) for path in save_panels(tmp_path, 3)]
+    monkeypatch.setattr("Figmaker.filedialog.askopenfilenames", lambda **k: paths + paths[:1])
+    
+    app.select_files()
+    assert [p['name'] for p in app.panels] == ['panel_0.png', 'panel_1.png', 'panel_2.png', 'panel_0.png']
+    assert app.panels[0]['pil_image'] is app.panels[3]['pil_image']
+    first = [p['pil_image'] for p in app.panels]
+    
+    # Selecting the same unchanged files again reuses the recently decoded images
+    app.select_files()
+    assert all(p['pil_image'] is image for p, image in zip(app.panels[4:], first, strict=True))
+
+
+def test_image_cache_drops_least_recently_used(dummy_app, tmp_path, monkeypatch):
+    app = dummy_app
+    monkeypatch.setattr("Figmaker.IMAGE_CACHE_SIZE", 2)
+    paths = [str(path) for path in save_panels(tmp_path, 3)]
+    
+    first, _ = app._open_panel_images(paths[:2], '7.0')
+    app._open_panel_images(paths[:1], '7.0')  # panel_0 becomes most recently used
+    app._open_panel_images(paths[2:], '7.0')
+    assert len(app._image_cache) == 2
+    assert app._open_panel_images(paths[:1], '7.0')[0] is first
+    assert [key[0] for key in app._image_cache] == [os.path.abspath(p) for p in (paths[2], paths[0])]
+
+
+def test_fast_png_export_writes_dpi(dummy_app, tmp_path, monkeypatch):
+    app = dummy_app
+    app.panels = [{'id': 1, 'pil_image': make_test_image(size=(120, 80)), 'name': 'img1', 'original_path': ''}]
+    app.assemble_figure()
+    out_path = tmp_path / "figure.png"
+    monkeypatch.setattr("Figmaker.filedialog.asksaveasfilename", lambda **k: str(out_path))
+    
+    app.export_figure()
+    with Image.open(out_path) as exported:
+        assert exported.size == app.assembled_image.size
+        assert tuple(round(v) for v in exported.info['dpi']) == (300, 300)